@@ -7,26 +7,72 @@ but different resolution suffixes in the URL), and removes the lower-resolution
 while keeping the highest quality one.
 """
 
+import argparse
 import os
 import re
 import sys
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from functools import partial
+from operator import itemgetter
 
-def extract_content_hash(filename, url_path=""):
+# Optional: move files to the recycle bin/trash instead of deleting them (--trash)
+try:
+    from send2trash import send2trash
+except ImportError:
+    send2trash = None
+
+# Stream the XML dumps with lxml when available, the stdlib parser otherwise
+try:
+    from lxml import etree
+except ImportError:
+    import xml.etree.ElementTree as etree
+
+# Optional: vectorized filename parsing for very large folders (--fast)
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# Number of files deleted concurrently with --execute. DeleteFileW is slow
+# per call but releases the GIL, so Windows gets a wider pool
+DELETE_WORKERS = 32 if sys.platform == 'win32' else 16
+
+# Report lines are collected and written to stdout in batches of this size
+OUTPUT_FLUSH_LINES = 1000
+
+# Separator line above the summary
+_SEP = "=" * 70
+
+# Image extensions that carry a _NNN/_NNNpx resolution suffix
+_EXTS = frozenset(('jpg', 'png', 'gif', 'webp'))
+_EXT_SUFFIXES = ('.jpg', '.png', '.gif', '.webp')
+
+# srcset attribute inside a post's regular-body HTML, and its "url NNNw" entries
+_SRCSET_RE = re.compile(r'srcset="([^"]+)"')
+_SRCSET_ENTRY_RE = re.compile(r'(https://\S+?)\s+(\d+)w')
+
+def split_resolution(filename):
     """
-    Extract the content hash from filename or URL.
-    Tumblr uses content-addressable filenames where the hash identifies the image content.
+    Split a filename into its base name and resolution suffix.
     
     Examples:
-        329d0da4eefa30f9c25e75a2776e709716e4013a.png (s1280x1920 version)
-        420140e71398807b80aa7d542d2e83e6cb80a9fc.png (s640x960 version)
-        
-    These would have different hashes but come from the same post in srcset.
-    We need to look at the URL structure instead.
+        tumblr_abc123_1280.jpg -> ('tumblr_abc123', 1280)
+        tumblr_xyz789_500px.png -> ('tumblr_xyz789', 500)
+        avatar.png -> None
     """
-    # For now, return the full filename as each resolution has a unique hash
-    # We'll need to track duplicates by analyzing XML srcset data
-    return None
+    # Plain string splitting instead of a regex: the names are structured
+    # enough that rpartition resolves extension and suffix in one pass
+    stem, _, ext = filename.rpartition('.')
+    if ext not in _EXTS:
+        return None
+    
+    base_name, sep, resolution = stem.rpartition('_')
+    if resolution.endswith('px'):
+        resolution = resolution[:-2]
+    if not sep or not 3 <= len(resolution) <= 4 or not resolution.isdecimal():
+        return None
+    
+    return base_name, int(resolution)
 
 def extract_resolution(filename):
     """
@@ -36,138 +82,468 @@ def extract_resolution(filename):
         tumblr_abc123_1280.jpg -> 1280
         tumblr_xyz789_500.jpg -> 500
     """
-    # Pattern for _NNNpx or _NNN suffix
-    match = re.search(r'_(\d{3,4})(?:px)?\.(?:jpg|png|gif|webp)', filename)
-    if match:
-        return int(match.group(1))
+    parts = split_resolution(filename)
+    if parts:
+        return parts[1]
     
     return None
 
-def find_resolution_duplicates(directory):
+def _file_versions(groups, kept_sizes=True):
+    """
+    Turn {name: [(resolution, DirEntry)]} groups into
+    {name: [(resolution, filename, filepath, file_size)]} records.
+    
+    The highest resolution of each group is the one that will be kept; with
+    kept_sizes=False it is not stat'ed and its file_size is None.
+    """
+    duplicates = {}
+    for name, versions in groups.items():
+        highest = max(versions, key=itemgetter(0))
+        records = []
+        for version in versions:
+            resolution, entry = version
+            file_size = None
+            if kept_sizes or version is not highest:
+                file_size = entry.stat(follow_symlinks=False).st_size
+            records.append((resolution, entry.name, entry.path, file_size))
+        duplicates[name] = records
+    return duplicates
+
+def find_resolution_duplicates(directory, kept_sizes=True, entries=None):
     """
     Find potential resolution duplicates by analyzing filenames.
     Groups files by their base name (without resolution suffix).
+    With kept_sizes=False the highest resolution file is not stat'ed.
+    entries can pass the directory's DirEntry list if it was already listed.
     
     Returns:
-        dict: {base_name: [(resolution, filename, filepath)]}
+        dict: {base_name: [(resolution, filename, filepath, file_size)]},
+              only for base names found in more than one resolution
     """
-    groups = defaultdict(list)
+    # Most base names only occur once, so only their DirEntry is kept until
+    # a second resolution shows up; files are stat'ed for their size only
+    # once the groups are complete
+    first_seen = {}
+    duplicates = {}
     
-    for filename in os.listdir(directory):
-        filepath = os.path.join(directory, filename)
-        
-        # Skip non-files and XML files
-        if not os.path.isfile(filepath) or filename.endswith('.xml'):
+    # scandir serves is_file() from the directory listing where it can,
+    # instead of one stat syscall per os.path call
+    if entries is None:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    for entry in entries:
+        filename = entry.name
+
+        # Skip anything that is not an image (XML dumps, .DS_Store, ...)
+        # before asking for the file type, then non-files
+        if not filename.endswith(_EXT_SUFFIXES) or not entry.is_file(follow_symlinks=False):
             continue
-        
-        # Extract resolution
-        resolution = extract_resolution(filename)
-        
-        if resolution:
-            # Extract base name (everything before _NNN)
-            base_match = re.match(r'(.*?)_\d{3,4}(?:px)?\.', filename)
-            if base_match:
-                base_name = base_match.group(1)
-                file_size = os.path.getsize(filepath)
-                groups[base_name].append((resolution, filename, filepath, file_size))
+
+        # Extract base name (everything before _NNN) and resolution
+        parts = split_resolution(filename)
+        if not parts:
+            continue
+        base_name, resolution = parts
+
+        if base_name in duplicates:
+            duplicates[base_name].append((resolution, entry))
+        elif base_name in first_seen:
+            first = first_seen.pop(base_name)
+            duplicates[base_name] = [(extract_resolution(first.name), first),
+                                     (resolution, entry)]
+        else:
+            first_seen[base_name] = entry
+    
+    return _file_versions(duplicates, kept_sizes)
+
+def find_resolution_duplicates_fast(directory, kept_sizes=True, entries=None):
+    """
+    Same as find_resolution_duplicates(), but parses all filenames in one
+    vectorized pandas pass instead of a Python loop per file.
+    Only worth it for folders with 100k+ files; requires pandas.
+    
+    Returns:
+        dict: {base_name: [(resolution, filename, filepath, file_size)]},
+              only for base names found in more than one resolution
+    """
+    if entries is None:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    entries = {entry.name: entry for entry in entries
+               if entry.name.endswith(_EXT_SUFFIXES) and entry.is_file(follow_symlinks=False)}
+    
+    names = pd.Series(list(entries), dtype=object)
+    parts = names.str.extract(r'^(.*?)_(\d{3,4})(?:px)?\.(?:jpg|png|gif|webp)$')
+    parts.columns = ['base', 'res']
+    parts['name'] = names
+    parts = parts.dropna()
+    parts = parts[parts.duplicated('base', keep=False)]
+    
+    duplicates = {}
+    for base_name, group in parts.groupby('base', sort=False):
+        duplicates[base_name] = [(int(resolution), entries[filename])
+                                 for resolution, filename in zip(group['res'], group['name'])]
+    
+    return _file_versions(duplicates, kept_sizes)
+
+def find_resolution_duplicates_recursive(root, scan=find_resolution_duplicates, jobs=None):
+    """
+    Find resolution duplicates in root and every directory below it.
+    Each directory is listed once on a thread pool; the listing yields its
+    subdirectories and is handed to scan(directory, entries=...), so slow
+    (e.g. network) filesystems can serve several listings at once.
+    jobs caps the number of directories scanned concurrently.
+    Directories that cannot be read are reported and skipped.
+    
+    Returns:
+        dict: {path/base_name: [(resolution, filename, filepath, file_size)]}
+              keyed by directory so files are never grouped across folders
+    """
+    def visit(directory):
+        with os.scandir(directory) as it:
+            entries = list(it)
+        subdirectories = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+        return subdirectories, scan(directory, entries=entries)
+    
+    found = {}
+    max_workers = jobs or min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(visit, root): root}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory = pending.pop(future)
+                try:
+                    subdirectories, groups = future.result()
+                except OSError as e:
+                    print(f"⚠️  Cannot scan {directory}: {e}")
+                    continue
+                for subdirectory in subdirectories:
+                    pending[executor.submit(visit, subdirectory)] = subdirectory
+                found[directory] = groups
     
-    # Filter to only groups with multiple resolutions
-    duplicates = {k: v for k, v in groups.items() if len(v) > 1}
+    # Directories finish in any order, report them sorted by path
+    duplicates = {}
+    for directory in sorted(found):
+        for base_name, versions in found[directory].items():
+            duplicates[os.path.join(directory, base_name)] = versions
     
     return duplicates
 
-def analyze_srcset_duplicates(directory, xml_directory=None):
+def analyze_srcset_duplicates(directory, xml_directory=None, kept_sizes=True, entries=None):
     """
     Analyze XML files to find images that were downloaded in multiple resolutions
     from the same srcset attribute.
     
     This is the accurate way to find duplicates caused by the srcset bug.
+    One srcset attribute lists the resolutions of one image, so the files
+    of one srcset form a group ranked by the srcset width. Groups that share
+    a file (the same image in several posts) are merged. Files as wide as
+    the widest one are never grouped as lower resolutions.
+    entries can pass the directory's DirEntry list if it was already listed.
+    
+    Returns:
+        dict: {url of the widest file: [(width, filename, filepath, file_size)]},
+              only for images with more than one resolution on disk
     """
     if xml_directory is None:
         xml_directory = directory
     
     print(f"🔍 Analyzing srcset data in {xml_directory}...")
     
-    # This would require parsing XML files and tracking which images
-    # came from the same srcset. For now, we'll use filename analysis.
+    if entries is None:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    present = {entry.name: entry for entry in entries
+               if entry.name.endswith(_EXT_SUFFIXES) and entry.is_file(follow_symlinks=False)}
+    if xml_directory != directory:
+        with os.scandir(xml_directory) as it:
+            entries = list(it)
+    xml_paths = [entry.path for entry in entries
+                 if entry.name.endswith('.xml') and entry.is_file(follow_symlinks=False)]
+    
+    # filename -> {filename: width} of the group it belongs to
+    group_of = {}
+    urls = {}
+    for xml_path in xml_paths:
+        try:
+            # Stream the dump post by post instead of loading the whole tree
+            for _, elem in etree.iterparse(xml_path, events=('end',)):
+                if elem.tag == 'regular-body' and elem.text:
+                    for srcset in _SRCSET_RE.findall(elem.text):
+                        files = {}
+                        for url, width in _SRCSET_ENTRY_RE.findall(srcset):
+                            url = url.split('?')[0]
+                            filename = url.rpartition('/')[2]
+                            if filename in present:
+                                files[filename] = int(width)
+                                urls[filename] = url
+                        # join the groups of files already seen in another srcset
+                        for filename in list(files):
+                            group = group_of.get(filename)
+                            if group is not None and group is not files:
+                                group.update(files)
+                                files = group
+                        for filename in files:
+                            group_of[filename] = files
+                elif elem.tag == 'post':
+                    elem.clear()
+        except etree.ParseError as e:
+            print(f"   ⚠️  Cannot parse {xml_path}: {e}")
+    
+    groups = {}
+    for files in {id(files): files for files in group_of.values()}.values():
+        widest = max(files, key=files.get)
+        versions = [(width, present[filename]) for filename, width in files.items()
+                    if filename == widest or width < files[widest]]
+        if len(versions) > 1:
+            groups[urls[widest]] = versions
     
-    # TODO: Implement XML parsing to find srcset groups
-    print("   (XML analysis not yet implemented, using filename analysis)")
+    duplicates = _file_versions(groups, kept_sizes)
     
-    return {}
+    print(f"   Found {len(duplicates)} srcset images with multiple resolutions\n")
+    
+    return duplicates
+
+def _remove_file(filepath):
+    """Delete a file, returning the error instead of raising it"""
+    try:
+        os.remove(filepath)
+    except OSError as e:
+        return e
+    return None
+
+def _trash_file(filepath):
+    """Move a file to the trash, returning the error instead of raising it"""
+    try:
+        send2trash(filepath)
+    except OSError as e:
+        return e
+    return None
+
+def _flush_lines(lines):
+    """Write buffered report lines to stdout in a single call and clear them"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
 
-def remove_lower_resolutions(duplicates, dry_run=True):
+def remove_lower_resolutions(duplicates, dry_run=True, quiet=False, trash=False,
+                             jobs=DELETE_WORKERS):
     """
     Remove lower resolution versions, keeping only the highest quality.
     
     Args:
         duplicates: dict from find_resolution_duplicates()
         dry_run: if True, only print what would be deleted
+        quiet: if True, only report errors instead of every kept/deleted file
+        trash: if True, move files to the trash with send2trash instead of deleting them
+        jobs: number of files deleted concurrently
     """
     total_removed = 0
     total_bytes_freed = 0
     
+    # Only the highest resolution matters, so pick it in one pass per group
+    # instead of sorting, and leave the versions lists untouched
+    plan = []
     for base_name, versions in duplicates.items():
-        # Sort by resolution descending
-        versions.sort(reverse=True, key=lambda x: x[0])
-        
-        highest_res, highest_file, highest_path, highest_size = versions[0]
+        highest = max(versions, key=itemgetter(0))
+        plan.append((base_name, highest, [v for v in versions
+                                          if v is not highest and v[0] < highest[0]]))
+    
+    # Unlink all lower resolutions up front on a thread pool, each os.remove
+    # blocks on the filesystem and releases the GIL while doing so
+    errors = None
+    if not dry_run:
+        filepaths = [filepath
+                     for _, _, lower in plan
+                     for _, _, filepath, _ in lower]
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            errors = iter(list(executor.map(_trash_file if trash else _remove_file, filepaths)))
+    
+    # Per-file reports are buffered rather than printed one by one, which
+    # costs a write (and flush, on a terminal) per line
+    lines = []
+    
+    for base_name, highest, lower in plan:
+        highest_res, highest_file, _, highest_size = highest
+        highest_size = "size not checked" if highest_size is None else f"{highest_size:,} bytes"
         
-        print(f"\n📁 {base_name}:")
-        print(f"   ✅ KEEP: {highest_file} ({highest_res}px, {highest_size:,} bytes)")
+        if not quiet:
+            lines.append(f"\n📁 {base_name}:")
+            lines.append(f"   ✅ KEEP: {highest_file} ({highest_res}px, {highest_size})")
         
-        # Remove all lower resolutions
-        for resolution, filename, filepath, file_size in versions[1:]:
+        # Report all lower resolutions
+        for resolution, filename, _, file_size in lower:
             if dry_run:
-                print(f"   ❌ WOULD DELETE: {filename} ({resolution}px, {file_size:,} bytes)")
+                if not quiet:
+                    lines.append(f"   ❌ WOULD DELETE: {filename} ({resolution}px, {file_size:,} bytes)")
+                continue
+            
+            error = next(errors)
+            if error is None:
+                if not quiet:
+                    lines.append(f"   ❌ {'TRASHED' if trash else 'DELETED'}: {filename} ({resolution}px, {file_size:,} bytes)")
+                total_removed += 1
+                total_bytes_freed += file_size
             else:
-                try:
-                    os.remove(filepath)
-                    print(f"   ❌ DELETED: {filename} ({resolution}px, {file_size:,} bytes)")
-                    total_removed += 1
-                    total_bytes_freed += file_size
-                except Exception as e:
-                    print(f"   ⚠️  ERROR deleting {filename}: {e}")
+                lines.append(f"   ⚠️  ERROR deleting {filename}: {error}")
+        
+        if len(lines) >= OUTPUT_FLUSH_LINES:
+            _flush_lines(lines)
+    
+    _flush_lines(lines)
     
     return total_removed, total_bytes_freed
 
+def _scan_with_srcset(directory, scan, kept_sizes=True, entries=None):
+    """
+    scan() one directory, then add the srcset groups from its .xml dumps.
+    Srcset groups that overlap a filename group are skipped, so no file is
+    both kept by one group and deleted by another.
+    """
+    if entries is None:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    duplicates = scan(directory, entries=entries)
+    grouped = {filepath for versions in duplicates.values() for _, _, filepath, _ in versions}
+    for prefix, versions in analyze_srcset_duplicates(directory, kept_sizes=kept_sizes,
+                                                      entries=entries).items():
+        if not any(filepath in grouped for _, _, filepath, _ in versions):
+            duplicates[prefix] = versions
+    return duplicates
+
+def scan_directory(directory, scan=find_resolution_duplicates, recursive=False, srcset=False,
+                   jobs=None, qualify=False, kept_sizes=True):
+    """
+    Find all resolution duplicates for one directory given on the command line.
+    
+    Args:
+        directory: folder to scan
+        scan: find_resolution_duplicates or find_resolution_duplicates_fast
+        recursive: if True, also scan every subdirectory
+        srcset: if True, also match srcset resolutions from the .xml dumps
+                (of every scanned directory with recursive)
+        jobs: number of subdirectories scanned concurrently with recursive
+        qualify: if True, prefix group names with the directory so groups
+                 from several directories can share one dict
+        kept_sizes: if False, skip the stat of the file each group keeps
+    """
+    scan = partial(scan, kept_sizes=kept_sizes)
+    if srcset:
+        scan = partial(_scan_with_srcset, scan=scan, kept_sizes=kept_sizes)
+    if recursive:
+        duplicates = find_resolution_duplicates_recursive(directory, scan=scan, jobs=jobs)
+    else:
+        duplicates = scan(directory)
+        if qualify:
+            duplicates = {os.path.join(directory, base_name): versions
+                          for base_name, versions in duplicates.items()}
+    
+    return duplicates
+
+
+def _positive_int(value):
+    """argparse type for --jobs"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got {value}")
+    return number
+
+def parse_args(argv=None):
+    """Parse the command line options"""
+    parser = argparse.ArgumentParser(
+        description="Find and remove lower-resolution duplicate images.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Example:\n"
+               "  python remove_duplicate_resolutions.py nubare\n"
+               "  python remove_duplicate_resolutions.py nubare --execute\n"
+               "  python remove_duplicate_resolutions.py nubare dethjunkie --execute\n"
+               "  python remove_duplicate_resolutions.py DOWNLOADS --recursive")
+    parser.add_argument("directories", nargs="+", metavar="directory",
+                        help="Directory to scan for duplicate resolutions")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--execute", action="store_true",
+                      help="Actually delete files")
+    mode.add_argument("--dry-run", action="store_true",
+                      help="Only print what would be deleted (default)")
+    parser.add_argument("--recursive", action="store_true",
+                        help="Also scan every subdirectory (e.g. the whole DOWNLOADS folder)")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="Only print errors and the summary, not every file")
+    parser.add_argument("--trash", action="store_true",
+                        help="With --execute, move files to the trash instead (needs send2trash)")
+    parser.add_argument("--fast", action="store_true",
+                        help="Parse filenames with pandas, for folders with 100k+ files")
+    parser.add_argument("--srcset", action="store_true",
+                        help="Also match srcset resolutions listed in the folder's .xml dumps "
+                             "(the crawl must run with DUMP_RAW_XML = True to save them)")
+    parser.add_argument("--jobs", type=_positive_int, metavar="N",
+                        help=f"Scan at most N directories and delete at most N files at once "
+                             f"(default {DELETE_WORKERS} deletes; 8 directories, "
+                             f"or up to 32 with --recursive)")
+    return parser.parse_args(argv)
+
 def main():
     """Main function to find and remove duplicate resolutions"""
     
-    if len(sys.argv) < 2:
-        print("Usage: python remove_duplicate_resolutions.py <directory> [--execute]")
-        print("\nOptions:")
-        print("  <directory>  Directory to scan for duplicate resolutions")
-        print("  --execute    Actually delete files (default is dry-run)")
-        print("\nExample:")
-        print("  python remove_duplicate_resolutions.py nubare")
-        print("  python remove_duplicate_resolutions.py nubare --execute")
+    args = parse_args()
+    directories = args.directories
+    execute = args.execute
+    
+    if args.trash and send2trash is None:
+        print("❌ Error: --trash requires send2trash (pip install send2trash)")
         sys.exit(1)
     
-    directory = sys.argv[1]
-    execute = '--execute' in sys.argv
+    for directory in directories:
+        if not os.path.isdir(directory):
+            print(f"❌ Error: Directory '{directory}' not found")
+            sys.exit(1)
     
-    if not os.path.isdir(directory):
-        print(f"❌ Error: Directory '{directory}' not found")
-        sys.exit(1)
+    print(f"{'🔍' if not execute else '🗑️ '} {'DRY RUN - ' if not execute else ''}Scanning {', '.join(directories)} for resolution duplicates...\n")
+    
+    scan = find_resolution_duplicates
+    if args.fast:
+        if pd is None:
+            print("⚠️  --fast requires pandas (pip install pandas), using the regular scan\n")
+        else:
+            scan = find_resolution_duplicates_fast
+    
+    # Find duplicates by filename pattern, scanning all directories in one
+    # process rather than one run of the script per folder. A dry run never
+    # adds up the kept files, so their sizes are not looked up
+    qualify = len(directories) > 1
+    
+    def scan_one(directory):
+        return scan_directory(directory, scan=scan, recursive=args.recursive, srcset=args.srcset,
+                              jobs=args.jobs, qualify=qualify, kept_sizes=execute)
     
-    print(f"{'🔍' if not execute else '🗑️ '} {'DRY RUN - ' if not execute else ''}Scanning {directory} for resolution duplicates...\n")
+    # --jobs caps the directories scanned at once overall. A recursive scan
+    # already runs that many on its own pool, so the given directories are
+    # then scanned one after another
+    max_workers = 1 if args.recursive else min(args.jobs or 8, len(directories))
     
-    # Find duplicates by filename pattern
-    duplicates = find_resolution_duplicates(directory)
+    duplicates = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for found in executor.map(scan_one, directories):
+            duplicates.update(found)
     
     if not duplicates:
         print("✅ No resolution duplicates found!")
         print("\nNote: This script detects duplicates with _NNN resolution suffixes.")
         print("If images have unique content hashes per resolution (common with srcset),")
         print("they won't be detected as duplicates by filename alone.")
+        if not args.srcset:
+            print("Run with --srcset to match them using the saved .xml responses")
+            print("(saved only when the crawl runs with DUMP_RAW_XML = True).")
         return
     
     print(f"📊 Found {len(duplicates)} groups with multiple resolutions\n")
     
-    total_removed, total_bytes_freed = remove_lower_resolutions(duplicates, dry_run=not execute)
+    total_removed, total_bytes_freed = remove_lower_resolutions(duplicates, dry_run=not execute,
+                                                               quiet=args.quiet, trash=args.trash,
+                                                               jobs=args.jobs or DELETE_WORKERS)
     
-    print("\n" + "="*70)
+    print("\n" + _SEP)
     if execute:
         print(f"✅ Removed {total_removed} lower-resolution files")
         print(f"💾 Freed {total_bytes_freed:,} bytes ({total_bytes_freed / (1024*1024):.2f} MB)")
@@ -5,17 +5,30 @@ import sys
 import requests
 import xmltodict
 from six.moves import queue as Queue
-from threading import Thread
+from threading import Thread, Lock, Timer, Condition
 import re
 import json
 import time
-from collections import defaultdict
+import atexit
+import logging
+import logging.handlers
+import shutil
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# orjson is optional - a lot faster than json for the growing stats file
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Setting timeout
 TIMEOUT = 10
 
 # Delay between downloads (in seconds) - set to 0 for no delay
+# Per thread on average: at most THREADS/DELAY downloads are started per second
 DELAY = 0.5  # Wait 0.5 seconds between each download
 
 # Retry times
@@ -27,126 +40,247 @@ START = 0
 # Numbers of photos/videos per page
 MEDIA_NUM = 50
 
+# Kinds of media downloaded from every site
+MEDIA_TYPES = ("photo", "video")
+
+# Numbers of API pages requested ahead while the current one is parsed
+PAGE_PREFETCH = 4
+
 # Numbers of downloading threads concurrently
 THREADS = 10
 
-# Do you like to dump each post as separate json (otherwise you have to extract from bulk xml files)
+# Bytes read from the network and written to disk per call
+CHUNK_SIZE = 256 * 1024
+
+# Do you like to dump each post as json (otherwise you have to extract from bulk xml files, see DUMP_RAW_XML)
+# Posts are written one per line to "{site}_posts.ndjson" in the site folder (rewritten on every run)
 # This option is for convenience for terminal users who would like to query e.g. with ./jq (https://stedolan.github.io/jq/)
 EACH_POST_AS_SEPARATE_JSON = False
 
+# Do you like to keep the raw API pages as "{site}_{type}_50_{start}.response.xml"
+# (for debugging, and needed by "remove_duplicate_resolutions.py --srcset")
+DUMP_RAW_XML = False
+
 # Downloads folder - all downloaded sites will be saved here
 DOWNLOADS_FOLDER = "DOWNLOADS"
 
 # Download statistics tracking
 DOWNLOAD_STATS_FILE = "download_stats.json"
 
+# Unsaved statistics are written out this often (in seconds) and at exit
+STATS_SAVE_INTERVAL = 30
+
+# Shared HTTP session - keeps connections (and TLS handshakes) alive across
+# downloads instead of opening a new one for every file
+SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=THREADS,
+                                         pool_maxsize=THREADS * 4,
+                                         max_retries=0)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# Progress messages - worker threads only put records on a queue, a single
+# listener thread formats them and writes them to stdout
+log = logging.getLogger("tumblr-crawler")
+log.setLevel(logging.INFO)
+log.propagate = False
+_log_queue = Queue.Queue()
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+
+
+def stop_logging():
+    """Write out all queued log records and stop the listener thread"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(stop_logging)
+
+
+class TokenBucket(object):
+    """Limits how often requests start, shared by all download threads"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._cond = Condition()
+
+    def take(self):
+        """Block until a request may start"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst,
+                                   self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                self._cond.wait((1 - self._tokens) / self.rate)
+
+
+# Global rate limiter for media downloads (None when DELAY is 0) - the same
+# ceiling as every thread waiting DELAY, but an idle thread's share is not lost
+download_limiter = TokenBucket(THREADS / DELAY, THREADS) if DELAY > 0 else None
+
+
+class SiteSession(object):
+    """Download counters of one site for the current run"""
+
+    __slots__ = ('photos_downloaded', 'videos_downloaded', 'start_time',
+                 'end_time', 'total_bytes', 'resolutions', 'resolution_bytes')
+
+    def __init__(self):
+        self.photos_downloaded = 0
+        self.videos_downloaded = 0
+        self.start_time = None
+        self.end_time = None
+        self.total_bytes = 0
+        self.resolutions = {}  # Track count per resolution
+        self.resolution_bytes = {}  # Track size per resolution
+
 
 class DownloadTracker:
     """Tracks download statistics for Tumblr blogs"""
 
     def __init__(self):
         self.stats = self.load_stats()
-        self.current_session = defaultdict(lambda: {
-            'photos_downloaded': 0,
-            'videos_downloaded': 0,
-            'start_time': None,
-            'end_time': None,
-            'total_bytes': 0,
-            'resolutions': defaultdict(int),  # Track count per resolution
-            'resolution_bytes': defaultdict(int)  # Track size per resolution
-        })
+        # stats are saved in the background rather than after every site
+        self._dirty = False
+        self._lock = Lock()
+        atexit.register(self.flush_stats)
+        self._schedule_flush()
+        self.current_session = defaultdict(SiteSession)
+        # workers record downloads concurrently; a separate lock so they
+        # never wait for a stats file write
+        self._session_lock = Lock()
 
     def load_stats(self):
         """Load existing download statistics from file"""
         if os.path.exists(DOWNLOAD_STATS_FILE):
             try:
-                with open(DOWNLOAD_STATS_FILE, 'r') as f:
-                    return json.load(f)
+                with open(DOWNLOAD_STATS_FILE, 'rb') as f:
+                    data = f.read()
+                return orjson.loads(data) if orjson else json.loads(data)
             except:
                 print("Warning: Could not load existing stats file, starting fresh")
                 return {}
         return {}
 
+    def _schedule_flush(self):
+        """Flush the stats again in STATS_SAVE_INTERVAL seconds"""
+        timer = Timer(STATS_SAVE_INTERVAL, self._periodic_flush)
+        timer.daemon = True
+        timer.start()
+
+    def _periodic_flush(self):
+        self.flush_stats()
+        self._schedule_flush()
+
+    def flush_stats(self):
+        """Save download statistics to file if they changed since the last save"""
+        if self._dirty:
+            self.save_stats()
+
     def save_stats(self):
         """Save download statistics to file"""
-        try:
-            with open(DOWNLOAD_STATS_FILE, 'w') as f:
-                json.dump(self.stats, f, indent=2, default=str)
-        except Exception as e:
-            print(f"Warning: Could not save stats: {e}")
+        with self._lock:
+            try:
+                if orjson:
+                    data = orjson.dumps(self.stats, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                else:
+                    data = json.dumps(self.stats, indent=2).encode('utf-8')
+                with open(DOWNLOAD_STATS_FILE, 'wb') as f:
+                    f.write(data)
+                self._dirty = False
+            except Exception as e:
+                print(f"Warning: Could not save stats: {e}")
 
     def start_site_download(self, site_name):
         """Mark the start of downloading for a site"""
-        self.current_session[site_name]['start_time'] = time.time()
-        print(f"📊 Started downloading from {site_name}")
+        self.current_session[site_name].start_time = time.time()
+        log.info("📊 Started downloading from %s", site_name)
 
     def record_download(self, site_name, medium_type, file_size=0, resolution=None):
         """Record a successful download with size and resolution info"""
-        if medium_type == "photo":
-            self.current_session[site_name]['photos_downloaded'] += 1
-        elif medium_type == "video":
-            self.current_session[site_name]['videos_downloaded'] += 1
-        
-        # Track total size
-        self.current_session[site_name]['total_bytes'] += file_size
-        
-        # Track resolution
-        if resolution:
-            self.current_session[site_name]['resolutions'][resolution] += 1
-            self.current_session[site_name]['resolution_bytes'][resolution] += file_size
+        with self._session_lock:
+            session = self.current_session[site_name]
+            if medium_type == "photo":
+                session.photos_downloaded += 1
+            elif medium_type == "video":
+                session.videos_downloaded += 1
+
+            # Track total size
+            session.total_bytes += file_size
+
+            # Track resolution
+            if resolution:
+                session.resolutions[resolution] = session.resolutions.get(resolution, 0) + 1
+                session.resolution_bytes[resolution] = session.resolution_bytes.get(resolution, 0) + file_size
 
     def finish_site_download(self, site_name):
         """Mark the completion of downloading for a site"""
-        self.current_session[site_name]['end_time'] = time.time()
-
-        # Update overall stats
-        if site_name not in self.stats:
-            self.stats[site_name] = {
-                'total_photos': 0,
-                'total_videos': 0,
-                'total_bytes': 0,
-                'resolutions': {},
-                'resolution_bytes': {},
-                'download_sessions': []
+        with self._session_lock:
+            session = self.current_session[site_name]
+            session.end_time = time.time()
+
+            # Copy the counters so later downloads don't change the saved session
+            session_resolutions = dict(session.resolutions)
+            session_resolution_bytes = dict(session.resolution_bytes)
+
+            # Add current session to stats
+            session_data = {
+                'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'photos_downloaded': session.photos_downloaded,
+                'videos_downloaded': session.videos_downloaded,
+                'bytes_downloaded': session.total_bytes,
+                'resolutions': session_resolutions,
+                'resolution_bytes': session_resolution_bytes,
+                'duration_seconds': round(session.end_time - session.start_time, 2)
             }
 
-        # Convert defaultdicts to regular dicts for JSON serialization
-        session_resolutions = dict(self.current_session[site_name]['resolutions'])
-        session_resolution_bytes = dict(self.current_session[site_name]['resolution_bytes'])
-        
-        # Add current session to stats
-        session_data = {
-            'date': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'photos_downloaded': self.current_session[site_name]['photos_downloaded'],
-            'videos_downloaded': self.current_session[site_name]['videos_downloaded'],
-            'bytes_downloaded': self.current_session[site_name]['total_bytes'],
-            'resolutions': session_resolutions,
-            'resolution_bytes': session_resolution_bytes,
-            'duration_seconds': round(self.current_session[site_name]['end_time'] - self.current_session[site_name]['start_time'], 2)
-        }
-
-        self.stats[site_name]['total_photos'] += session_data['photos_downloaded']
-        self.stats[site_name]['total_videos'] += session_data['videos_downloaded']
-        self.stats[site_name]['total_bytes'] += session_data['bytes_downloaded']
-        
-        # Merge resolution counts
-        for res, count in session_resolutions.items():
-            self.stats[site_name]['resolutions'][res] = self.stats[site_name]['resolutions'].get(res, 0) + count
-        
-        # Merge resolution bytes
-        for res, size in session_resolution_bytes.items():
-            self.stats[site_name]['resolution_bytes'][res] = self.stats[site_name]['resolution_bytes'].get(res, 0) + size
-        
-        self.stats[site_name]['download_sessions'].append(session_data)
-
-        # Save updated stats
-        self.save_stats()
+        # Update overall stats; they are written out by the periodic/exit
+        # flush instead of rewriting the whole file after every site
+        with self._lock:
+            if site_name not in self.stats:
+                self.stats[site_name] = {
+                    'total_photos': 0,
+                    'total_videos': 0,
+                    'total_bytes': 0,
+                    'resolutions': {},
+                    'resolution_bytes': {},
+                    'download_sessions': []
+                }
+
+            self.stats[site_name]['total_photos'] += session_data['photos_downloaded']
+            self.stats[site_name]['total_videos'] += session_data['videos_downloaded']
+            self.stats[site_name]['total_bytes'] += session_data['bytes_downloaded']
+
+            # Merge resolution counts
+            for res, count in session_resolutions.items():
+                self.stats[site_name]['resolutions'][res] = self.stats[site_name]['resolutions'].get(res, 0) + count
+
+            # Merge resolution bytes
+            for res, size in session_resolution_bytes.items():
+                self.stats[site_name]['resolution_bytes'][res] = self.stats[site_name]['resolution_bytes'].get(res, 0) + size
+
+            self.stats[site_name]['download_sessions'].append(session_data)
+            self._dirty = True
 
         # Print summary
         total_media = session_data['photos_downloaded'] + session_data['videos_downloaded']
         duration = session_data['duration_seconds']
         size_mb = session_data['bytes_downloaded'] / (1024 * 1024)
-        print(f"📊 Finished {site_name}: {session_data['photos_downloaded']} photos, {session_data['videos_downloaded']} videos ({total_media} total, {size_mb:.1f} MB) in {duration}s")
+        log.info("📊 Finished %s: %s photos, %s videos (%s total, %.1f MB) in %ss",
+                 site_name, session_data['photos_downloaded'], session_data['videos_downloaded'],
+                 total_media, size_mb, duration)
 
     def get_site_summary(self, site_name):
         """Get summary statistics for a site"""
@@ -208,75 +342,112 @@ class DownloadTracker:
 download_tracker = DownloadTracker()
 
 
-def video_source_match():
+# Regexes are compiled once here instead of on every post/file
+_SRCSET_RE = re.compile(r'srcset="([^"]+)"')
+_SRCSET_ENTRY_RE = re.compile(r'(https://\S+)\s+(\d+)w')
+_IMG_SRC_RE = re.compile(r'<img[^>]*src="([^"]+)"')
+_RES_SXY_RE = re.compile(r'/s(\d+)x\d+/')
+_RES_UNDER_RE = re.compile(r'_(\d+)\.(jpg|png|gif)')
+_VIDEO_SOURCE_RE = re.compile(r'<source\s+src="([^"]*\.mp4[^"]*)"[^>]*>', re.IGNORECASE)
+_VIDEO_HD_RE = re.compile(r'.*"hdUrl":("([^\s,]*)"|false),')
+_VIDEO_DEFAULT_RE = re.compile(r'.*src="(\S*)" ', re.DOTALL)
+
+# API pages are cleaned down to printable ASCII (0x20-0x7f); every other byte,
+# including all bytes of multi-byte UTF-8 characters, is deleted
+_XML_KEEP_BYTES = bytes(range(0x20, 0x80))
+_XML_DELETE_BYTES = bytes(c for c in range(256) if c not in _XML_KEEP_BYTES)
+
+
+@lru_cache(maxsize=4096)
+def _folder_resolution(url_folder):
+    """Resolution from a /s1280x1920/ path segment, cached per CDN folder"""
+    res_match = _RES_SXY_RE.search(url_folder + "/")
+    if res_match:
+        return f"{res_match.group(1)}px"
+    return None
+
+
+def _extract_resolution(url):
+    """Resolution label of a media URL (e.g. s1280x1920, _1280) or unknown"""
+    url_folder, _, name = url.split("?")[0].rpartition("/")
+    resolution = _folder_resolution(url_folder)
+    if resolution is None:
+        # Format: _1280.jpg
+        res_match = _RES_UNDER_RE.search(name)
+        if res_match:
+            resolution = f"{res_match.group(1)}px"
+    return resolution or "unknown"
+
+
+def video_source_match(video_player):
     """Extract video URL from <source src="..."> tags (current Tumblr format)"""
-    source_pattern = re.compile(r'<source\s+src="([^"]*\.mp4[^"]*)"[^>]*>', re.IGNORECASE)
-
-    def match(video_player):
-        source_match = source_pattern.search(video_player)
-        if source_match is not None:
-            try:
-                return source_match.group(1)
-            except:
-                return None
-        return None
-    return match
+    source_match = _VIDEO_SOURCE_RE.search(video_player)
+    if source_match is not None:
+        return source_match.group(1)
+    return None
 
 
-def video_hd_match():
+def video_hd_match(video_player):
     """Extract HD video URL from JSON data-crt-options (legacy format)"""
-    hd_pattern = re.compile(r'.*"hdUrl":("([^\s,]*)"|false),')
+    hd_match = _VIDEO_HD_RE.search(video_player)
+    if hd_match is not None and hd_match.group(1) != 'false':
+        return hd_match.group(2).replace('\\', '')
+    return None
 
-    def match(video_player):
-        hd_match = hd_pattern.search(video_player)
-        try:
-            if hd_match is not None and hd_match.group(1) != 'false':
-                return hd_match.group(2).replace('\\', '')
-        except:
-            return None
-    return match
 
-
-def video_default_match():
+def video_default_match(video_player):
     """Extract video URL from src attributes (legacy iframe format)"""
-    default_pattern = re.compile(r'.*src="(\S*)" ', re.DOTALL)
+    default_match = _VIDEO_DEFAULT_RE.match(video_player)
+    if default_match is not None:
+        return default_match.group(1)
+    return None
 
-    def match(video_player):
-        default_match = default_pattern.match(video_player)
-        if default_match is not None:
-            try:
-                return default_match.group(1)
-            except:
-                return None
-    return match
+
+# will iterate all the rules
+# the first matched result will be returned
+VIDEO_REGEX_RULES = (video_source_match, video_hd_match, video_default_match)
 
 
 class DownloadWorker(Thread):
-    def __init__(self, queue, proxies=None):
+    # makes checking and claiming a file name in existing one step
+    _claim_lock = Lock()
+
+    def __init__(self, queue, proxies=None, session=SESSION):
         Thread.__init__(self)
         self.queue = queue
         self.proxies = proxies
+        self.session = session
         self._register_regex_match_rules()
 
     def run(self):
         while True:
-            medium_type, post, target_folder = self.queue.get()
-            self.download(medium_type, post, target_folder)
-            self.queue.task_done()
-
-    def download(self, medium_type, post, target_folder):
+            task = self.queue.get()
+            if task is None:
+                # no more sites to download
+                self.queue.task_done()
+                break
+            medium_type, post, target_folder, existing = task
+            try:
+                self.download(medium_type, post, target_folder, existing)
+            except Exception:
+                # keep the worker alive for the remaining downloads
+                log.exception("Unexpected error while downloading %s post %s",
+                              medium_type, post.get('@id', 'unknown'))
+            finally:
+                self.queue.task_done()
+
+    def download(self, medium_type, post, target_folder, existing):
         try:
             medium_url = self._handle_medium_url(medium_type, post)
             if medium_url is not None:
-                self._download(medium_type, medium_url, target_folder, post.get('@id', 'unknown'))
+                self._download(medium_type, medium_url, target_folder, existing,
+                               post.get('@id', 'unknown'))
         except TypeError:
             pass
 
     # can register different regex match rules
     def _register_regex_match_rules(self):
-        # will iterate all the rules
-        # the first matched result will be returned
-        self.regex_rules = [video_source_match(), video_hd_match(), video_default_match()]
+        self.regex_rules = VIDEO_REGEX_RULES
 
     def _handle_medium_url(self, medium_type, post):
         try:
@@ -290,27 +461,18 @@ class DownloadWorker(Thread):
                         regular_body = post["regular-body"]
                         
                         # First try to extract from srcset attribute (highest quality)
-                        srcset_match = re.search(r'srcset="([^"]+)"', regular_body)
+                        srcset_match = _SRCSET_RE.search(regular_body)
                         if srcset_match:
-                            srcset = srcset_match.group(1)
                             # Parse srcset entries: "url 640w, url 1280w, ..."
-                            entries = []
-                            for entry in srcset.split(','):
-                                entry = entry.strip()
-                                # Extract URL and width from "https://...url NNNw" format
-                                url_width_match = re.search(r'(https://[^\s]+)\s+(\d+)w', entry)
-                                if url_width_match:
-                                    url = url_width_match.group(1)
-                                    width = int(url_width_match.group(2))
-                                    entries.append((width, url))
-                            
-                            # Sort by width descending and return highest quality
+                            # as (url, width) pairs in a single scan
+                            entries = _SRCSET_ENTRY_RE.findall(srcset_match.group(1))
+
+                            # Return URL of highest width
                             if entries:
-                                entries.sort(reverse=True)  # Sort by width (first element of tuple)
-                                return entries[0][1]  # Return URL of highest width
+                                return max(entries, key=lambda entry: int(entry[1]))[0]
                         
                         # Fall back to src attribute if no srcset
-                        img_matches = re.findall(r'<img[^>]*src="([^"]+)"', regular_body)
+                        img_matches = _IMG_SRC_RE.findall(regular_body)
                         if img_matches:
                             return img_matches[0]  # Return the first image found
                     except:
@@ -332,7 +494,7 @@ class DownloadWorker(Thread):
                             "issues/new attached with below information:\n\n"
                             "%s" % post)
 
-    def _download(self, medium_type, medium_url, target_folder, post_id='unknown'):
+    def _download(self, medium_type, medium_url, target_folder, existing, post_id='unknown'):
         # Extract site name from target folder path
         site_name = os.path.basename(target_folder)
 
@@ -351,49 +513,49 @@ class DownloadWorker(Thread):
         medium_name = final_url.split("/")[-1].split("?")[0]
         
         # Extract resolution from URL if present (e.g., s1280x1920, _1280)
-        resolution = None
-        if 's' in final_url and 'x' in final_url:
-            # Format: s1280x1920
-            res_match = re.search(r'/s(\d+)x\d+/', final_url)
-            if res_match:
-                resolution = f"{res_match.group(1)}px"
-        elif '_1280' in final_url or '_500' in final_url:
-            # Format: _1280.jpg
-            res_match = re.search(r'_(\d+)\.(jpg|png|gif)', final_url)
-            if res_match:
-                resolution = f"{res_match.group(1)}px"
-        
-        if not resolution:
-            resolution = "unknown"
+        resolution = _extract_resolution(final_url)
 
         file_path = os.path.join(target_folder, medium_name)
-        if not os.path.isfile(file_path):
-            print("Downloading %s from %s.\n" % (medium_name,
-                                                 final_url))
+        # existing is the set of file names already in target_folder (or
+        # being downloaded); claim the name first, so a media URL queued by
+        # several posts (e.g. reblogs) is only downloaded by one worker
+        with self._claim_lock:
+            claimed = medium_name not in existing
+            if claimed:
+                existing.add(medium_name)
+        if claimed:
+            log.info("Downloading %s from %s.", medium_name, final_url)
             retry_times = 0
             while retry_times < RETRY:
                 try:
-                    resp = requests.get(final_url,
-                                        stream=True,
-                                        proxies=self.proxies,
-                                        timeout=TIMEOUT)
-                    if resp.status_code == 403:
-                        retry_times = RETRY
-                        print("Access Denied when retrieve %s.\n" % final_url)
-                        raise Exception("Access Denied")
-                    
-                    file_size = 0
-                    with open(file_path, 'wb') as fh:
-                        for chunk in resp.iter_content(chunk_size=1024):
-                            fh.write(chunk)
-                            file_size += len(chunk)
-                    
+                    if download_limiter is not None:
+                        download_limiter.take()
+                    # the with block hands the connection back to the pool
+                    with self.session.get(final_url,
+                                          stream=True,
+                                          proxies=self.proxies,
+                                          timeout=TIMEOUT) as resp:
+                        if resp.status_code == 403:
+                            retry_times = RETRY
+                            log.info("Access Denied when retrieve %s.", final_url)
+                            raise Exception("Access Denied")
+                        if resp.status_code >= 400:
+                            # other client errors won't change on a retry,
+                            # except timeouts and rate limiting
+                            if resp.status_code < 500 and resp.status_code not in (408, 429):
+                                retry_times = RETRY
+                            log.info("HTTP %s when retrieve %s.", resp.status_code, final_url)
+                            raise Exception("HTTP %s" % resp.status_code)
+
+                        # copy straight from the raw stream in large blocks
+                        # (still undoing any gzip/deflate transfer encoding)
+                        resp.raw.decode_content = True
+                        with open(file_path, 'wb') as fh:
+                            shutil.copyfileobj(resp.raw, fh, CHUNK_SIZE)
+                            file_size = fh.tell()
+
                     # Record successful download with size and resolution
                     download_tracker.record_download(site_name, medium_type, file_size, resolution)
-                    
-                    # Add delay between downloads if configured
-                    if DELAY > 0:
-                        time.sleep(DELAY)
                     break
                 except:
                     # try again
@@ -404,113 +566,163 @@ class DownloadWorker(Thread):
                     os.remove(file_path)
                 except OSError:
                     pass
-                print("Failed to retrieve %s from %s.\n" % (medium_type,
-                                                          final_url))
+                # let a later post or run try this file again
+                existing.discard(medium_name)
+                log.info("Failed to retrieve %s from %s.", medium_type, final_url)
 
 
 class CrawlerScheduler(object):
 
-    def __init__(self, sites, proxies=None):
+    def __init__(self, sites, proxies=None, session=SESSION):
         self.sites = sites
         self.proxies = proxies
+        self.session = session
         self.queue = Queue.Queue()
         self.scheduling()
 
     def scheduling(self):
         # create workers
+        workers = []
         for x in range(THREADS):
             worker = DownloadWorker(self.queue,
-                                    proxies=self.proxies)
+                                    proxies=self.proxies,
+                                    session=self.session)
             # Setting daemon to True will let the main thread exit
-            # even though the workers are blocking
+            # on Ctrl+C even though the workers are blocking
             worker.daemon = True
             worker.start()
+            workers.append(worker)
 
         for site in self.sites:
             self.download_media(site)
 
+        # one sentinel per worker, then wait for all of them to stop
+        for worker in workers:
+            self.queue.put(None)
+        for worker in workers:
+            worker.join()
+
     def download_media(self, site):
         # Track start of site download
         download_tracker.start_site_download(site)
 
-        self.download_photos(site)
-        self.download_videos(site)
+        target_folder = os.path.join(os.getcwd(), DOWNLOADS_FOLDER, site)
+        os.makedirs(target_folder, exist_ok=True)
 
-        # Track completion of site download
-        download_tracker.finish_site_download(site)
+        # list the folder once, so workers can skip already downloaded
+        # files without a stat per file; they add what they download
+        with os.scandir(target_folder) as it:
+            existing = {entry.name for entry in it}
 
-    def download_videos(self, site):
-        self._download_media(site, "video", START)
-        # wait for the queue to finish processing all the tasks from one
-        # single site
-        self.queue.join()
-        print("Finish Downloading All the videos from %s" % site)
+        if EACH_POST_AS_SEPARATE_JSON:
+            # every run dumps all posts again, so start the file afresh;
+            # the pages of both media types are appended to it
+            open(os.path.join(target_folder, "{0}_posts.ndjson".format(site)), "wb").close()
 
-    def download_photos(self, site):
-        self._download_media(site, "photo", START)
+        # queue photos and videos together, so the workers keep downloading
+        # photos while the video pages are listed
+        for medium_type in MEDIA_TYPES:
+            self._download_media(site, medium_type, START,
+                                 target_folder, existing)
         # wait for the queue to finish processing all the tasks from one
         # single site
         self.queue.join()
-        print("Finish Downloading All the photos from %s" % site)
-
-    def _download_media(self, site, medium_type, start):
-        current_folder = os.getcwd()
-        # Use DOWNLOADS folder if configured
-        downloads_folder = os.path.join(current_folder, DOWNLOADS_FOLDER)
-        if not os.path.isdir(downloads_folder):
-            os.makedirs(downloads_folder)
-        target_folder = os.path.join(downloads_folder, site)
-        if not os.path.isdir(target_folder):
-            os.mkdir(target_folder)
+        log.info("Finish Downloading All the photos and videos from %s", site)
+
+        # Track completion of site download
+        download_tracker.finish_site_download(site)
+
+    def _download_media(self, site, medium_type, start, target_folder, existing):
+        post_count = 0
+        page_posts = []
+        posts_file = os.path.join(target_folder, "{0}_posts.ndjson".format(site))
+
+        def handle_post(path, post):
+            nonlocal post_count
+            # only tumblr/posts/post, not e.g. the tumblelog's children
+            if path[-1][0] != "post" or path[-2][0] != "posts":
+                return True
+            post_count += 1
+
+            # by default it is switched to false to generate less files,
+            # as anyway you can extract this from bulk xml files (DUMP_RAW_XML).
+            if EACH_POST_AS_SEPARATE_JSON:
+                page_posts.append(post)
+
+            try:
+                # if post has photoset, walk into photoset for each photo
+                photoset = post["photoset"]["photo"]
+                for photo in photoset:
+                    self.queue.put((medium_type, photo, target_folder, existing))
+            except:
+                # select the largest resolution
+                # usually in the first element
+                self.queue.put((medium_type, post, target_folder, existing))
+            return True
 
         base_url = "https://{0}.tumblr.com/api/read?type={1}&num={2}&start={3}"
-        start = START
-        while True:
+
+        def request_page(start):
             media_url = base_url.format(site, medium_type, MEDIA_NUM, start)
-            response = requests.get(media_url,
-                                    proxies=self.proxies)
-            if response.status_code == 404:
-                print("Site %s does not exist" % site)
-                break
+            return start, media_url, executor.submit(self.session.get,
+                                                     media_url,
+                                                     proxies=self.proxies)
+
+        # keep the next pages in flight, so their round trips overlap with
+        # parsing and queueing the current one
+        with ThreadPoolExecutor(max_workers=PAGE_PREFETCH) as executor:
+            pages = deque(request_page(START + i * MEDIA_NUM)
+                          for i in range(PAGE_PREFETCH))
+            next_start = START + PAGE_PREFETCH * MEDIA_NUM
+
+            while pages:
+                start, media_url, future = pages.popleft()
+                response = future.result()
+                if response.status_code == 404:
+                    log.info("Site %s does not exist", site)
+                    break
 
-            try:
-                xml_cleaned = re.sub(u'[^\x20-\x7f]+',
-                                     u'', response.content.decode('utf-8'))
-
-                response_file = os.path.join(target_folder, "{0}_{1}_{2}_{3}.response.xml".format(site, medium_type, MEDIA_NUM, start))
-                with open(response_file, "w") as text_file:
-                    text_file.write(xml_cleaned)
-
-                data = xmltodict.parse(xml_cleaned)
-                posts = data["tumblr"]["posts"]["post"]
-                for post in posts:
-                    # by default it is switched to false to generate less files,
-                    # as anyway you can extract this from bulk xml files.
-                    if EACH_POST_AS_SEPARATE_JSON:
-                        post_json_file = os.path.join(target_folder, "{0}_post_id_{1}.post.json".format(site, post['@id']))
-                        with open(post_json_file, "w") as text_file:
-                            text_file.write(json.dumps(post))
+                try:
+                    xml_cleaned = response.content.translate(
+                        None, _XML_DELETE_BYTES).decode('ascii')
+
+                    if DUMP_RAW_XML:
+                        response_file = os.path.join(target_folder, "{0}_{1}_{2}_{3}.response.xml".format(site, medium_type, MEDIA_NUM, start))
+                        with open(response_file, "w") as text_file:
+                            text_file.write(xml_cleaned)
+
+                    # stream the page post by post instead of building the
+                    # whole document as nested dicts first
+                    post_count = 0
+                    del page_posts[:]
+                    xmltodict.parse(xml_cleaned, item_depth=3,
+                                    item_callback=handle_post)
+
+                    # write the page's posts once its downloads are queued,
+                    # so the workers don't wait for them
+                    if page_posts:
+                        with open(posts_file, "ab") as out:
+                            for post in page_posts:
+                                if orjson:
+                                    out.write(orjson.dumps(post))
+                                else:
+                                    out.write(json.dumps(post).encode('utf-8'))
+                                out.write(b"\n")
+                    if post_count == 0:
+                        # past the last page
+                        break
+                    pages.append(request_page(next_start))
+                    next_start += MEDIA_NUM
+                except KeyError:
+                    break
+                except Exception as e:
+                    log.exception("Error from URL %s: %s", media_url, e)
+                    pages.appendleft(request_page(start))
+                    continue
 
-                    try:
-                        # if post has photoset, walk into photoset for each photo
-                        photoset = post["photoset"]["photo"]
-                        for photo in photoset:
-                            self.queue.put((medium_type, photo, target_folder))
-                    except:
-                        # select the largest resolution
-                        # usually in the first element
-                        self.queue.put((medium_type, post, target_folder))
-                start += MEDIA_NUM
-            except KeyError:
-                break
-            except UnicodeDecodeError:
-                print("Cannot decode response data from URL %s" % media_url)
-                continue
-            except Exception as e:
-                import traceback
-                print("Error from URL %s: %s" % (media_url, str(e)))
-                traceback.print_exc()
-                continue
+            # drop the pages requested past the end
+            for _, _, future in pages:
+                future.cancel()
 
 
 def usage():
@@ -590,5 +802,6 @@ if __name__ == "__main__":
     # Run the crawler
     CrawlerScheduler(sites, proxies=proxies)
 
-    # Print final statistics summary
+    # Print final statistics summary, after the last queued log lines
+    stop_logging()
     download_tracker.print_overall_summary()
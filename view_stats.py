@@ -6,6 +6,13 @@ Simple script to view download statistics from download_stats.json
 import json
 import os
 from datetime import datetime
+from operator import itemgetter
+
+# orjson is optional - a lot faster than json for a large stats file
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 def format_number(num):
     """Format large numbers with commas"""
@@ -35,8 +42,9 @@ def view_download_stats():
         return
 
     try:
-        with open(stats_file, 'r') as f:
-            stats = json.load(f)
+        with open(stats_file, 'rb') as f:
+            data = f.read()
+        stats = orjson.loads(data) if orjson else json.loads(data)
     except Exception as e:
         print(f"❌ Error reading stats file: {e}")
         return
@@ -103,9 +111,11 @@ def view_download_stats():
         
         if resolutions:
             print(f"   📊 Resolution breakdown:")
-            # Sort by resolution (numeric part)
-            sorted_res = sorted(resolutions.items(), key=lambda x: int(x[0].replace('px', '').replace('unknown', '0')), reverse=True)
-            for res, count in sorted_res:
+            # Sort by resolution (numeric part), "unknown" and any other label last
+            keyed_res = [(int(res[:-2]) if res.endswith('px') and res[:-2].isdigit() else 0, res, count)
+                         for res, count in resolutions.items()]
+            keyed_res.sort(key=itemgetter(0), reverse=True)
+            for _, res, count in keyed_res:
                 size = resolution_bytes.get(res, 0)
                 print(f"      {res:>10}: {format_number(count):>6} files ({format_bytes(size)})")
         